@@ -1,7 +1,7 @@
 #!/bin/bash
 
 if [ -z "$1" ]; then
-    echo "Usage: ./process-videos.sh /path/to/video/directory"
+    echo "Usage: ./process-videos.sh /path/to/video/directory [--model NAME] [--compute-type TYPE] [--force]"
     exit 1
 fi
 
@@ -18,4 +18,5 @@ fi
 ABSOLUTE_PATH=$(realpath "$1")
 
 # Run the docker container with auto-removal
-docker run --rm $GPU_FLAG -v "$ABSOLUTE_PATH:/videos" brandonaaskov/video-miner
\ No newline at end of file
+# Any extra arguments (e.g. --model base) are passed through to video-miner.py
+docker run --rm $GPU_FLAG -v "$ABSOLUTE_PATH:/videos" brandonaaskov/video-miner "${@:2}"
\ No newline at end of file
@@ -2,12 +2,34 @@
 
 import os
 import sys
+import platform
 import subprocess
-import whisper
+import wave
+import av
+import numpy as np
+import ctranslate2
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.vad import VadOptions, collect_chunks, get_speech_timestamps
 from pathlib import Path
 import logging
 import argparse
-import json
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from multiprocessing import get_context
+from contextlib import contextmanager
+try:
+    from av.codec.hwaccel import HWAccel, hwdevices_available
+except ImportError:  # PyAV < 14 has no hardware decoding support
+    HWAccel = None
+try:
+    import mlx_whisper
+except ImportError:  # Only installable on Apple Silicon
+    mlx_whisper = None
+try:
+    from turbojpeg import TJSAMP_420, TurboJPEG
+    turbo_jpeg = TurboJPEG()
+except (ImportError, RuntimeError, OSError, AttributeError):  # PyTurboJPEG also needs a loadable libturbojpeg
+    turbo_jpeg = None
 
 # Set up logging
 logging.basicConfig(
@@ -18,118 +40,225 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class VideoProcessor:
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, model_size: str = 'distil-large-v3', compute_type: str = None,
+                 force: bool = False):
         self.base_dir = Path(base_dir)
         self.audio_dir = self.base_dir / 'audio'
         self.frames_dir = self.base_dir / 'frames'
         self.transcripts_dir = self.base_dir / 'transcripts'
         self.captions_dir = self.base_dir / 'captions'
         self.supported_formats = {'.mp4', '.mov', '.avi', '.mkv', '.ts', '.m2ts'}
+        self.bitmap_subtitle_codecs = {'dvd_subtitle', 'dvb_subtitle', 'hdmv_pgs_subtitle', 'xsub'}
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.force = force
+        # MLX ports of the presets offered on the command line
+        self.mlx_models = {
+            'base': 'mlx-community/whisper-base-mlx',
+            'small': 'mlx-community/whisper-small-mlx',
+            'distil-large-v3': 'mlx-community/distil-whisper-large-v3',
+        }
+        self._model = None
+        self._pipeline = None
+        self.batch_size = 16
+        # Silero VAD drops silences longer than 160ms (the batched pipeline's own default) and
+        # pads each speech region by 500ms; the pipeline caps chunks at 30s by itself
+        self.vad_parameters = {'min_silence_duration_ms': 160, 'speech_pad_ms': 500}
+        # Audio shorter than one full batch of 30s chunks is pooled with other short files
+        self.bucket_seconds = self.batch_size * 30
+        self.device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        # Beam search multiplies decoder work; on CPU greedy decoding is the better trade
+        self.beam_size = 5 if self.device == "cuda" else 1
+        # On CPU-only hosts Whisper gets all but one core for the whole run, and extraction
+        # stays at a couple of workers: it finishes long before transcription does, and each
+        # worker's ffmpeg and libav decoder already start several threads of their own.
+        # With a GPU, Whisper needs little CPU, so extraction gets all but one core.
+        cores = os.cpu_count() or 2
+        self.transcribe_threads = max(1, cores - 1) if self.device == "cpu" else 1
+        self.extract_workers = min(2, cores) if self.device == "cpu" else max(1, cores - 1)
+        # Decode on NVDEC when a GPU is present and this libav build supports CUDA devices
+        self.nvdec_available = (
+            HWAccel is not None
+            and 'cuda' in hwdevices_available()
+            and self.device == "cuda"
+        )
+        # Every NVDEC decoder opens its own CUDA context on the card the Whisper model lives
+        # on, so only this many extraction workers decode on the GPU at once
+        self.nvdec_sessions = 2
+        if turbo_jpeg is not None:
+            logger.info("Encoding frames with TurboJPEG (libjpeg-turbo)")
+        else:
+            logger.info("TurboJPEG unavailable, encoding frames with Pillow")
+        # Apple Silicon has no CUDA, but MLX can run Whisper on its GPU
+        self.use_mlx = (
+            mlx_whisper is not None
+            and sys.platform == 'darwin'
+            and platform.machine() == 'arm64'
+        )
         
         # Create output directories
         for directory in [self.audio_dir, self.frames_dir, self.transcripts_dir, self.captions_dir]:
             directory.mkdir(exist_ok=True)
             logger.info(f"Created/verified directory: {directory}")
 
-    def extract_captions(self, video_path: Path) -> bool:
-        """Extract closed captions from video file."""
+    @property
+    def model(self):
+        """Whisper model, loaded once on first use and reused for every file."""
+        if self._model is None:
+            if self.compute_type:
+                compute_type = self.compute_type
+            elif self.device == "cuda":
+                # Keep activations in FP16 on the GPU; older cards without FP16 support
+                # fall back to whatever CTranslate2 considers their default
+                supported = ctranslate2.get_supported_compute_types("cuda")
+                compute_type = next(
+                    (t for t in ("int8_float16", "float16") if t in supported),
+                    "default"
+                )
+            else:
+                # int8 weights cut memory traffic and use VNNI dot products on recent x86 CPUs
+                compute_type = "int8"
+            logger.info(f"Loading Whisper model {self.model_size} on {self.device} ({compute_type})...")
+            self._model = WhisperModel(
+                self.model_size,
+                device=self.device,
+                compute_type=compute_type,
+                cpu_threads=self.transcribe_threads
+            )
+        return self._model
+
+    @property
+    def pipeline(self):
+        """Batched wrapper around the model that decodes several speech chunks per GPU pass."""
+        if self._pipeline is None:
+            self._pipeline = BatchedInferencePipeline(model=self.model)
+        return self._pipeline
+
+    def is_up_to_date(self, output_path: Path, source_path: Path) -> bool:
+        """Check whether an earlier run already produced output_path from the current source."""
+        return (
+            not self.force
+            and output_path.exists()
+            and output_path.stat().st_mtime >= source_path.stat().st_mtime
+        )
+
+    def part_path(self, output_path: Path) -> Path:
+        """Temporary name an output is written under until it is complete."""
+        return output_path.with_name(output_path.name + '.part')
+
+    def extract_audio_and_captions(self, video_path: Path) -> tuple:
+        """Extract audio and closed captions from video file in a single ffmpeg pass."""
         try:
             filename = video_path.stem
-            srt_output = self.captions_dir / f"{filename}.srt"
+            audio_path = None
+            captions_extracted = False
             
-            # First, check for subtitle streams
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-select_streams', 's',
-                '-show_entries', 'stream=index:stream_tags=language,title',
-                '-of', 'json',
-                str(video_path)
-            ]
+            # First, check for audio and subtitle streams (read from the container in-process).
+            # Bitmap formats (DVD/Blu-ray/DVB) cannot be converted to SRT, so skip them.
+            with av.open(str(video_path)) as container:
+                has_audio = bool(container.streams.audio)
+                subtitle_streams = [
+                    (stream.index, stream.metadata.get('language', 'und'))
+                    for stream in container.streams.subtitles
+                    if stream.codec_context.name not in self.bitmap_subtitle_codecs
+                ]
             
-            probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-            streams_info = json.loads(probe_result.stdout)
+            # ffmpeg writes to .part files that are only renamed once it succeeds, so a run
+            # that crashes midway never leaves output that later looks up to date
+            audio_args = []
+            output_path = self.audio_dir / f"{filename}.wav"
+            if not has_audio:
+                logger.error(f"No audio stream found in {video_path.name}")
+            elif self.is_up_to_date(output_path, video_path):
+                logger.info(f"Audio for {video_path.name} is up to date, skipping")
+                audio_path = output_path
+            else:
+                logger.info(f"Extracting audio from {video_path.name}...")
+                audio_args = [
+                    '-map', '0:a:0',
+                    '-ac', '1',          # Mono audio
+                    '-ar', '16000',      # Whisper's native sample rate, so it never resamples
+                    '-c:a', 'pcm_s16le', # Uncompressed WAV, no encoder/decoder round trip
+                    '-f', 'wav',
+                    str(self.part_path(output_path))
+                ]
             
-            if 'streams' in streams_info and streams_info['streams']:
-                # Process each subtitle stream
-                for stream in streams_info['streams']:
-                    stream_index = stream['index']
-                    lang = stream.get('tags', {}).get('language', 'und')
-                    
-                    # Prioritize English subtitles
-                    if lang in ['eng', 'en']:
-                        output_file = self.captions_dir / f"{filename}_eng.srt"
-                        
-                        extract_cmd = [
-                            'ffmpeg', '-y',
-                            '-i', str(video_path),
-                            '-map', f'0:{stream_index}',
-                            str(output_file)
-                        ]
-                        
-                        subprocess.run(extract_cmd, capture_output=True)
-                        logger.info(f"Extracted English captions from {video_path.name}")
-                        return True
+            caption_args = []
+            caption_files = []
+            for stream_index, lang in subtitle_streams:
+                caption_file = self.captions_dir / f"{filename}_{lang}.srt"
+                if caption_file in caption_files:
+                    caption_file = self.captions_dir / f"{filename}_{lang}_{stream_index}.srt"
+                caption_files.append(caption_file)
+                caption_args += ['-map', f'0:{stream_index}', '-c:s', 'srt', '-f', 'srt', str(self.part_path(caption_file))]
             
-            # If no English subtitles found, try extracting CEA-608/708 captions
-            cea_output = self.captions_dir / f"{filename}_cea608.srt"
-            cea_cmd = [
-                'ffmpeg', '-y',
-                '-i', str(video_path),
-                '-map', '0:c:s',
-                '-c:s', 'srt',
-                str(cea_output)
-            ]
+            if caption_files and all(self.is_up_to_date(f, video_path) for f in caption_files):
+                logger.info(f"Captions for {video_path.name} are up to date, skipping")
+                caption_args = []
+                captions_extracted = True
             
-            subprocess.run(cea_cmd, capture_output=True)
+            # One ffmpeg process demuxes the file once and writes the audio and every
+            # subtitle track from that pass; a broken subtitle track must not cost us the
+            # audio, so retry with the audio alone if the combined run fails
+            attempts = [(audio_args + caption_args, bool(caption_args))]
+            if audio_args and caption_args:
+                attempts.append((audio_args, False))
             
-            # Check if the output file has content
-            if cea_output.exists() and cea_output.stat().st_size > 100:
-                logger.info(f"Extracted CEA-608/708 captions from {video_path.name}")
-                return True
-            else:
-                if cea_output.exists():
-                    cea_output.unlink()  # Remove empty file
-                logger.info(f"No captions found in {video_path.name}")
-                return False
+            for output_args, includes_captions in attempts:
+                if not output_args:
+                    continue
                 
-        except Exception as e:
-            logger.error(f"Error extracting captions: {str(e)}")
-            return False
-
-    def extract_audio(self, video_path: Path) -> Path:
-        """Extract audio from video file."""
-        try:
-            output_path = self.audio_dir / f"{video_path.stem}.mp3"
-            logger.info(f"Extracting audio from {video_path.name}...")
-            
-            command = [
-                'ffmpeg', '-y',
-                '-i', str(video_path),
-                '-vn',                # Disable video
-                '-ac', '1',          # Mono audio
-                '-ar', '44100',      # Sample rate
-                '-q:a', '0',         # Highest quality
-                str(output_path)
-            ]
-            
-            # Run ffmpeg command
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True
-            )
+                # Run ffmpeg command (stderr is only kept for the failure log)
+                result = subprocess.run(
+                    ['ffmpeg', '-y', '-i', str(video_path)] + output_args,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    bufsize=1 << 20,
+                    text=True
+                )
+                
+                if result.returncode == 0:
+                    if audio_args:
+                        self.part_path(output_path).replace(output_path)
+                        logger.info(f"Successfully extracted audio to {output_path}")
+                        audio_path = output_path
+                    if includes_captions:
+                        for caption_file in caption_files:
+                            self.part_path(caption_file).replace(caption_file)
+                        logger.info(f"Extracted {len(caption_files)} caption track(s) from {video_path.name}")
+                        captions_extracted = True
+                    break
+                logger.error(f"Failed to extract audio/captions: {result.stderr}")
+                
+                # Don't leave the failed run's partial outputs behind
+                if audio_args:
+                    self.part_path(output_path).unlink(missing_ok=True)
+                if includes_captions:
+                    for caption_file in caption_files:
+                        self.part_path(caption_file).unlink(missing_ok=True)
             
-            if result.returncode == 0:
-                logger.info(f"Successfully extracted audio to {output_path}")
-                return output_path
-            else:
-                logger.error(f"Failed to extract audio: {result.stderr}")
-                return None
+            return audio_path, captions_extracted
                 
         except Exception as e:
-            logger.error(f"Error extracting audio: {str(e)}")
-            return None
+            logger.error(f"Error extracting audio and captions: {str(e)}")
+            return None, False
+
+    @contextmanager
+    def nvdec_slot(self):
+        """Yield whether a decode may use NVDEC, holding one of the shared slots while it does."""
+        if not self.nvdec_available:
+            yield False
+        elif _nvdec_slots is None:
+            # Not running in an extraction worker, so there is nothing to share
+            yield True
+        elif _nvdec_slots.acquire(block=False):
+            try:
+                yield True
+            finally:
+                _nvdec_slots.release()
+        else:
+            # All slots are taken; decode this video on the CPU instead of waiting
+            yield False
 
     def extract_frames(self, video_path: Path) -> bool:
         """Extract frames every 60 seconds from video."""
@@ -138,32 +267,44 @@ class VideoProcessor:
             output_dir = self.frames_dir / video_path.stem
             output_dir.mkdir(exist_ok=True)
             
-            # Get video duration using ffprobe
-            duration_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(video_path)
-            ]
+            # Decode in-process with libav: metadata comes straight from the container and
+            # each frame is reached by seeking to the nearest keyframe, with no ffmpeg/ffprobe forks
+            with self.nvdec_slot() as use_nvdec:
+                open_options = {}
+                if use_nvdec:
+                    # Falls back to software decoding for codecs NVDEC cannot handle
+                    open_options['hwaccel'] = HWAccel(device_type='cuda', allow_software_fallback=True)
             
-            duration = float(subprocess.check_output(duration_cmd).decode().strip())
-            
-            # Extract a frame every 60 seconds
-            for second in range(0, int(duration), 60):
-                output_path = output_dir / f"{video_path.stem}-{second}s.jpg"
+                # JPEG encoding and the file write release the GIL, so they are handed to writer
+                # threads while the decoder seeks on to the next frame
+                with av.open(str(video_path), **open_options) as container, \
+                        ThreadPoolExecutor(max_workers=2) as writers:
+                    stream = container.streams.video[0]
+                    stream.thread_type = 'AUTO'
+                    start = container.start_time or 0
+                    duration = (container.duration or 0) / av.time_base
                 
-                command = [
-                    'ffmpeg', '-y',
-                    '-ss', str(second),
-                    '-i', str(video_path),
-                    '-vframes', '1',
-                    '-q:v', '2',
-                    str(output_path)
-                ]
+                    # Extract a frame every 60 seconds
+                    writes = []
+                    for second in range(0, int(duration), 60):
+                        target = start / av.time_base + second
+                        output_path = output_dir / f"{video_path.stem}-{second}s.jpg"
+                        if self.is_up_to_date(output_path, video_path):
+                            continue
+                    
+                        container.seek(start + second * av.time_base)
+                        frame = next(
+                            (f for f in container.decode(stream) if f.time is not None and f.time >= target),
+                            None
+                        )
+                        if frame is None:
+                            break
+                    
+                        writes.append((second, writers.submit(self.write_jpeg, frame, output_path)))
                 
-                subprocess.run(command, capture_output=True)
-                logger.info(f"Extracted frame at {second}s from {video_path.name}")
+                    for second, write in writes:
+                        write.result()
+                        logger.info(f"Extracted frame at {second}s from {video_path.name}")
                 
             return True
             
@@ -171,19 +312,173 @@ class VideoProcessor:
             logger.error(f"Error extracting frames: {str(e)}")
             return False
 
+    def write_jpeg(self, frame: av.VideoFrame, output_path: Path):
+        """Encode a decoded frame as JPEG and write it to output_path."""
+        part_path = self.part_path(output_path)
+        if turbo_jpeg is not None:
+            # TurboJPEG encodes the decoded pixels directly, with no PIL image in between;
+            # 4:2:0 chroma subsampling, the same as Pillow writes
+            pixels = frame.to_ndarray(format='bgr24')
+            part_path.write_bytes(turbo_jpeg.encode(pixels, quality=92, jpeg_subsample=TJSAMP_420))
+        else:
+            frame.to_image().save(part_path, format='JPEG', quality=92)
+        part_path.replace(output_path)
+
+    def save_transcript(self, output_path: Path, text: str):
+        """Write a transcript, only giving it its final name once it is complete."""
+        part_path = self.part_path(output_path)
+        with open(part_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        part_path.replace(output_path)
+
+    def load_audio(self, audio_path: Path) -> np.ndarray:
+        """Read an extracted WAV file into the float32 array Whisper expects."""
+        # The WAV is already 16kHz mono s16le, so read the samples straight into the array
+        # instead of letting faster-whisper decode and resample the file
+        with wave.open(str(audio_path), 'rb') as wav:
+            samples = wav.readframes(wav.getnframes())
+        return np.frombuffer(samples, np.int16).astype(np.float32) / 32768.0
+
+    def audio_duration(self, audio_path: Path) -> float:
+        """Duration of an extracted WAV file in seconds, read from its header."""
+        with wave.open(str(audio_path), 'rb') as wav:
+            return wav.getnframes() / wav.getframerate()
+
+    def bucket_by_length(self, audio_files: list) -> list:
+        """Group (duration, path) pairs of similar length into buckets of at most bucket_seconds."""
+        buckets = []
+        bucket = []
+        bucket_seconds = 0
+        for duration, audio_path in sorted(audio_files):
+            if bucket and bucket_seconds + duration > self.bucket_seconds:
+                buckets.append(bucket)
+                bucket = []
+                bucket_seconds = 0
+            bucket.append(audio_path)
+            bucket_seconds += duration
+        if bucket:
+            buckets.append(bucket)
+        return buckets
+
+    def transcribe_bucket(self, audio_paths: list) -> int:
+        """Transcribe several short audio files together so their speech chunks share batches."""
+        transcribed = 0
+        pending = []
+        for audio_path in audio_paths:
+            if self.is_up_to_date(self.transcripts_dir / f"{audio_path.stem}.txt", audio_path):
+                logger.info(f"Transcript for {audio_path.name} is up to date, skipping")
+                transcribed += 1
+            else:
+                pending.append(audio_path)
+        
+        # MLX has no batched pipeline, and a single file gains nothing from pooling
+        if self.use_mlx or len(pending) < 2:
+            for audio_path in pending:
+                transcribed += self.transcribe_audio(audio_path)
+            return transcribed
+        
+        # Whisper pads every chunk to 30s, so a short file on its own decodes a nearly
+        # empty batch. Run VAD per file, then pack every file's speech chunks into one
+        # array and decode them together, grouped by language since a batch shares one.
+        vad_options = VadOptions(**self.vad_parameters, max_speech_duration_s=30)
+        groups = {}
+        for audio_path in pending:
+            try:
+                logger.info(f"Transcribing {audio_path.name}...")
+                audio = self.load_audio(audio_path)
+                speech = get_speech_timestamps(audio, vad_options)
+                chunks = [chunk for chunk in collect_chunks(audio, speech, max_duration=30)[0] if len(chunk)]
+                
+                language = None
+                if chunks:
+                    language = "en"
+                    if self.model.model.is_multilingual:
+                        language, _, _ = self.model.detect_language(audio=np.concatenate(chunks))
+            except Exception as e:
+                # Only this file is lost; the rest of the bucket still decodes together
+                logger.error(f"Error during transcription of {audio_path.name}: {str(e)}")
+                continue
+            groups.setdefault(language, []).append((audio_path, chunks))
+        
+        for language, files in groups.items():
+            pieces = []
+            clips = []
+            file_starts = []
+            offset = 0
+            for _, chunks in files:
+                file_starts.append(offset / 16000)
+                for chunk in chunks:
+                    pieces.append(chunk)
+                    clips.append({'start': offset / 16000, 'end': (offset + len(chunk)) / 16000})
+                    offset += len(chunk)
+            
+            texts = [[] for _ in files]
+            if clips:
+                try:
+                    segments, _ = self.pipeline.transcribe(
+                        np.concatenate(pieces),
+                        language=language,
+                        beam_size=self.beam_size,
+                        clip_timestamps=clips,
+                        batch_size=self.batch_size
+                    )
+                    # Every chunk lies inside one file, so its midpoint tells whose text it is
+                    for segment in segments:
+                        owner = bisect_right(file_starts, (segment.start + segment.end) / 2) - 1
+                        texts[owner].append(segment.text)
+                except Exception as e:
+                    # Pooling must never cost more than the per-file path, so retry one by one
+                    logger.error(f"Batched transcription failed, transcribing files separately: {str(e)}")
+                    for audio_path, _ in files:
+                        transcribed += self.transcribe_audio(audio_path)
+                    continue
+            
+            # Save transcriptions
+            for (audio_path, _), text in zip(files, texts):
+                output_path = self.transcripts_dir / f"{audio_path.stem}.txt"
+                try:
+                    self.save_transcript(output_path, "".join(text))
+                except Exception as e:
+                    logger.error(f"Error saving transcript for {audio_path.name}: {str(e)}")
+                    continue
+                logger.info(f"Transcription saved to {output_path}")
+                transcribed += 1
+        
+        return transcribed
+
     def transcribe_audio(self, audio_path: Path) -> bool:
         """Transcribe audio file using Whisper."""
         try:
-            logger.info(f"Loading Whisper model...")
-            model = whisper.load_model("base")
+            output_path = self.transcripts_dir / f"{audio_path.stem}.txt"
+            if self.is_up_to_date(output_path, audio_path):
+                logger.info(f"Transcript for {audio_path.name} is up to date, skipping")
+                return True
             
             logger.info(f"Transcribing {audio_path.name}...")
-            result = model.transcribe(str(audio_path))
+            audio = self.load_audio(audio_path)
+            
+            if self.use_mlx:
+                # MLX runs Whisper on the Apple GPU through Metal and caches the model itself
+                result = mlx_whisper.transcribe(
+                    audio,
+                    path_or_hf_repo=self.mlx_models.get(self.model_size, self.model_size),
+                    condition_on_previous_text=False
+                )
+                text = result["text"]
+            else:
+                # Speech chunks found by VAD are decoded in batches
+                segments, _ = self.pipeline.transcribe(
+                    audio,
+                    beam_size=self.beam_size,
+                    vad_filter=True,
+                    vad_parameters=self.vad_parameters,
+                    batch_size=self.batch_size
+                )
+                # Segments are generated lazily, so this is where the decode runs
+                text = "".join(segment.text for segment in segments)
             
             # Save transcription
-            output_path = self.transcripts_dir / f"{audio_path.stem}.txt"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(result["text"])
+            self.save_transcript(output_path, text)
                 
             logger.info(f"Transcription saved to {output_path}")
             return True
@@ -216,26 +511,53 @@ class VideoProcessor:
             'captions_extracted': 0
         }
 
-        for video_path in video_files:
-            logger.info(f"\nProcessing {video_path.name}...")
-            stats['processed'] += 1
+        # Videos are extracted in parallel worker processes (spawned, so CUDA state is never
+        # forked); the main process keeps the Whisper model and transcribes as videos finish
+        context = get_context('spawn')
+        nvdec_slots = context.BoundedSemaphore(self.nvdec_sessions)
+        with ProcessPoolExecutor(max_workers=self.extract_workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(nvdec_slots,)) as pool:
+            try:
+                jobs = {}
+                for video_path in video_files:
+                    logger.info(f"\nProcessing {video_path.name}...")
+                    stats['processed'] += 1
+                    jobs[pool.submit(_process_one, self, video_path)] = video_path
 
-            # Extract captions
-            if self.extract_captions(video_path):
-                stats['captions_extracted'] += 1
+                # Long audio fills batches on its own and is transcribed right away; short audio is
+                # held back and transcribed in length-sorted buckets once a full batch is waiting
+                short_audio = []
+                short_seconds = 0
+                for job in as_completed(jobs):
+                    captions_extracted, audio_path, frames_extracted = job.result()
+                    stats['captions_extracted'] += captions_extracted
+                    stats['frames_extracted'] += frames_extracted
 
-            # Extract audio
-            audio_path = self.extract_audio(video_path)
-            if audio_path:
-                stats['audio_extracted'] += 1
-                
-                # Transcribe audio
-                if self.transcribe_audio(audio_path):
-                    stats['transcribed'] += 1
+                    if audio_path:
+                        stats['audio_extracted'] += 1
 
-            # Extract frames
-            if self.extract_frames(video_path):
-                stats['frames_extracted'] += 1
+                        # Transcribe audio
+                        duration = self.audio_duration(audio_path)
+                        if duration >= self.bucket_seconds:
+                            if self.transcribe_audio(audio_path):
+                                stats['transcribed'] += 1
+                        else:
+                            short_audio.append((duration, audio_path))
+                            short_seconds += duration
+
+                    if short_seconds >= self.bucket_seconds:
+                        for bucket in self.bucket_by_length(short_audio):
+                            stats['transcribed'] += self.transcribe_bucket(bucket)
+                        short_audio = []
+                        short_seconds = 0
+
+                for bucket in self.bucket_by_length(short_audio):
+                    stats['transcribed'] += self.transcribe_bucket(bucket)
+            except BaseException:
+                # Leaving the with-block would wait for every queued video; on Ctrl-C or an
+                # error, drop the queue instead so the run stops promptly
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
 
         # Print summary
         logger.info("\nProcessing complete!")
@@ -245,13 +567,47 @@ class VideoProcessor:
         logger.info(f"Successfully transcribed {stats['transcribed']} videos")
         logger.info(f"Successfully extracted captions from {stats['captions_extracted']} videos")
 
+    def __getstate__(self):
+        # Worker processes only run the extraction stages, so never ship the model to them
+        state = self.__dict__.copy()
+        state['_model'] = None
+        state['_pipeline'] = None
+        return state
+
+# Semaphore shared by the extraction workers to cap concurrent NVDEC decoders
+_nvdec_slots = None
+
+def _init_worker(nvdec_slots):
+    """Hand each extraction worker the shared NVDEC semaphore."""
+    global _nvdec_slots
+    _nvdec_slots = nvdec_slots
+
+def _process_one(processor: VideoProcessor, video_path: Path) -> tuple:
+    """Run the extraction stages for one video inside a worker process."""
+    # Frames are decoded in-process by libav while a single ffmpeg pass writes the audio
+    # and captions; the two share no state and release the GIL, so they run side by side
+    with ThreadPoolExecutor(max_workers=1) as stages:
+        frames_job = stages.submit(processor.extract_frames, video_path)
+        audio_path, captions_extracted = processor.extract_audio_and_captions(video_path)
+        return captions_extracted, audio_path, frames_job.result()
+
 def main():
     parser = argparse.ArgumentParser(description='Process videos for frame extraction and transcription')
     parser.add_argument('directory', type=str, help='Directory containing video files')
+    parser.add_argument('--model', type=str, default='distil-large-v3',
+                        help='Whisper model to transcribe with, e.g. base, small or distil-large-v3 '
+                             '(default: distil-large-v3, which is English-only; use small or large-v3 '
+                             'for other languages)')
+    parser.add_argument('--compute-type', type=str, default=None,
+                        help='CTranslate2 compute type, e.g. int8_float16, float16 or int8 '
+                             '(default: int8_float16 on GPU, int8 on CPU)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-extract and re-transcribe even when outputs are already up to date')
     args = parser.parse_args()
 
     try:
-        processor = VideoProcessor(args.directory)
+        processor = VideoProcessor(args.directory, model_size=args.model, compute_type=args.compute_type,
+                                   force=args.force)
         processor.process_videos()
     except KeyboardInterrupt:
         logger.info("\nProcess interrupted by user")